@@ -8,6 +8,8 @@ Usage:
     python3 batch_exr_to_editorial.py /path/to/renders/ [--output-dir /path/to/editorial/]
     python3 batch_exr_to_editorial.py /path/to/renders/ --dry-run
     python3 batch_exr_to_editorial.py /path/to/renders/ --shot ACD1000
+    python3 batch_exr_to_editorial.py /path/to/renders/ --jobs 4
+    python3 batch_exr_to_editorial.py /path/to/renders/ --gpu
 
 Examples:
     # Process all shots in renders directory
@@ -19,22 +21,45 @@ Examples:
     # Process specific shot only
     python3 batch_exr_to_editorial.py /renders/ --shot ACD1000
 
+    # Encode 4 shots at a time
+    python3 batch_exr_to_editorial.py /renders/ --jobs 4
+
+    # Do the OCIO color transform on the GPU (falls back to CPU)
+    python3 batch_exr_to_editorial.py /renders/ --gpu
+
 Requirements:
     - OpenImageIO (oiiotool) with OCIO support
     - FFmpeg with DNxHD encoder
     - OCIO 2.3+ with built-in ACES configs
+    - Optional: OpenImageIO Python bindings (faster timecode reads than iinfo)
+    - Optional: ocioconvert built with GPU support (for --gpu)
 """
 
 import os
 import re
 import sys
 import argparse
+import datetime
+import hashlib
+import io
+import shutil
 import subprocess
 import tempfile
-import shutil
+import threading
+from collections import deque
+from contextlib import redirect_stdout
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+)
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
+# OIIO Python bindings are optional - only used to read timecode metadata
+try:
+    import OpenImageIO as oiio
+except ImportError:
+    oiio = None
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -51,71 +76,138 @@ DNXHR_PROFILE = "dnxhr_sq"
 # Default FPS
 DEFAULT_FPS = 24
 
+# Tool paths, resolved once (None if not on PATH - checked in main)
+OIIOTOOL = shutil.which("oiiotool")
+FFMPEG = shutil.which("ffmpeg")
+IINFO = shutil.which("iinfo")
+OCIOCONVERT = shutil.which("ocioconvert")
+
 # IMPORTANT: Always start at frame 1000 (slate frame)
 SLATE_FRAME = 1000
 
+# Default concurrent shots - oiiotool and ffmpeg are multithreaded themselves,
+# so only run a quarter as many shots as there are cores
+DEFAULT_JOBS = max(1, (os.cpu_count() or 1) // 4)
+
+# Temp locations for --gpu intermediates, fastest first. The first local one
+# with room for the shot wins; /mnt/caches exists on every render node
+TEMP_DIR_CANDIDATES = ["/dev/shm", tempfile.gettempdir(), "/mnt/caches/cache_ffmpeg"]
+TEMP_MIN_FREE_BYTES = 2 * 1024 ** 3
+
+# Graded float EXRs can be larger than the (compressed) source frames
+GPU_TEMP_SIZE_FACTOR = 2
+
+# Network filesystems - never used for intermediates unless nothing else fits
+NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs", "afpfs"}
+
+# Frames graded concurrently by --gpu (one on the GPU while the other does I/O)
+GPU_PIPELINE_DEPTH = 2
+
+# Lines of oiiotool/ffmpeg stderr kept for error reports
+STDERR_TAIL_LINES = 200
+
+# Share of available RAM handed to oiiotool's ImageCache (split across jobs)
+IMAGECACHE_MEMORY_FRACTION = 0.25
+
+# oiiotool's own --cache default (MB) - only ever raised, never lowered
+OIIOTOOL_DEFAULT_CACHE_MB = 4096
+
 
 # =============================================================================
 # Sequence Detection
 # =============================================================================
 
+# Sequence filename: (head)(frame number)(.ext) - parsed in a single match
+_SEQ_RE = re.compile(r'^(.*?)(\d+)(\.[^.]+)$')
+
+# HH:MM:SS:FF (or ;FF for drop frame) timecode string
+_TIMECODE_RE = re.compile(r'(\d{2}:\d{2}:\d{2}[:;]\d{2})')
+
+# Directories listed concurrently (NAS listings are latency bound)
+SCAN_WORKERS = 16
+
+
 def detect_sequence_padding(filename: str) -> Tuple[Optional[int], Optional[str]]:
     """Detect frame padding from filename, return (padding_length, extension)."""
-    match = re.search(r'(\d+)(\.[^.]+)$', filename)
+    match = _SEQ_RE.match(filename)
     if match:
-        digits = match.group(1)
-        ext = match.group(2)
+        _, digits, ext = match.groups()
         return len(digits), ext
     return None, None
 
 
-def find_exr_sequences(root_dir: str, shot_filter: Optional[str] = None) -> List[Dict]:
-    """
-    Find EXR sequences in directory.
-    Returns list of dicts with: dir, head, ext, pad, start, end, count
-    """
+def _classify_dir(dirpath: str, files: List[str], shot_filter: Optional[str] = None) -> List[Dict]:
+    """Group the EXR filenames of a single directory into sequence dicts."""
     sequences = []
+    candidates = {}
+
+    for f in files:
+        # Optional shot filter
+        if shot_filter and shot_filter not in f:
+            continue
+
+        match = _SEQ_RE.match(f)
+        if not match:
+            continue
+
+        # Head is everything before the frame number
+        head, frame, ext = match.groups()
+        key = (head, ext, len(frame))
+        candidates.setdefault(key, []).append(int(frame))
+
+    for (head, ext, pad), frames in candidates.items():
+        sequences.append({
+            "dir": Path(dirpath),
+            "head": head,
+            "ext": ext,
+            "pad": pad,
+            "start": min(frames),
+            "end": max(frames),
+            "count": len(frames),
+        })
 
-    for dirpath, _, files in os.walk(root_dir):
-        candidates = {}
-
-        for f in files:
-            if not f.endswith('.exr'):
-                continue
-
-            # Optional shot filter
-            if shot_filter and shot_filter not in f:
-                continue
-
-            pad, ext = detect_sequence_padding(f)
-            if pad is None:
-                continue
+    return sequences
 
-            # Extract head (everything before frame number)
-            head = re.sub(r'\d+(\.[^.]+)$', '', f)
-            key = (head, ext, pad)
-            candidates.setdefault(key, []).append(f)
 
-        for (head, ext, pad), seq_files in candidates.items():
-            seq_files.sort()
+def _scan_dir(dirpath: str, shot_filter: Optional[str] = None) -> Tuple[List[str], List[Dict]]:
+    """List one directory with os.scandir, return (subdirectories, sequences in it)."""
+    subdirs = []
+    exr_files = []
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                # d_type comes from the directory listing - no extra stat per file
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.exr'):
+                    exr_files.append(entry.name)
+    except OSError:
+        # Unreadable directory - skip it, as os.walk would
+        return [], []
 
-            # Extract frame numbers
-            start_match = re.search(r'(\d+)\.[^.]+$', seq_files[0])
-            end_match = re.search(r'(\d+)\.[^.]+$', seq_files[-1])
+    return subdirs, _classify_dir(dirpath, exr_files, shot_filter)
 
-            if not start_match or not end_match:
-                continue
 
-            sequences.append({
-                "dir": Path(dirpath),
-                "head": head,
-                "ext": ext,
-                "pad": pad,
-                "start": int(start_match.group(1)),
-                "end": int(end_match.group(1)),
-                "count": len(seq_files),
-            })
+def find_exr_sequences(root_dir: str, shot_filter: Optional[str] = None) -> List[Dict]:
+    """
+    Find EXR sequences in directory.
+    Returns list of dicts with: dir, head, ext, pad, start, end, count
+    """
+    sequences = []
 
+    # Each directory is listed on the thread pool as soon as its parent has
+    # been read, so NAS round trips overlap
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        pending = {executor.submit(_scan_dir, root_dir, shot_filter)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, dir_sequences = future.result()
+                sequences.extend(dir_sequences)
+                pending.update(executor.submit(_scan_dir, d, shot_filter) for d in subdirs)
+
+    # Directories finish in any order - keep the processing order stable
+    sequences.sort(key=lambda seq: (str(seq['dir']), seq['head']))
     return sequences
 
 
@@ -128,11 +220,51 @@ def frame_to_timecode(frame: int, fps: int = 24) -> str:
     return f"{hours:02d}:{mins:02d}:{secs:02d}:{frames:02d}"
 
 
+def smpte_to_timecode(packed: int) -> str:
+    """
+    Decode a SMPTE 12M packed BCD time value (smpte:TimeCode[0]) to HH:MM:SS:FF,
+    or HH:MM:SS;FF when the drop-frame flag (bit 6) is set - ffmpeg -timecode
+    reads the ';' as drop frame.
+    """
+    def bcd(shift: int, tens_bits: int) -> int:
+        units = (packed >> shift) & 0xF
+        tens = (packed >> (shift + 4)) & ((1 << tens_bits) - 1)
+        return tens * 10 + units
+
+    sep = ';' if packed & 0x40 else ':'
+    return f"{bcd(24, 2):02d}:{bcd(16, 3):02d}:{bcd(8, 3):02d}{sep}{bcd(0, 2):02d}"
+
+
 def get_exr_timecode(exr_path: str) -> Optional[str]:
-    """Try to extract timecode from EXR metadata using iinfo."""
+    """Try to extract timecode from EXR metadata (OIIO Python bindings, else iinfo)."""
+    if oiio is not None:
+        try:
+            inp = oiio.ImageInput.open(exr_path)
+            if inp is None:
+                return None
+            try:
+                spec = inp.spec()
+                tc = spec.getattribute('smpte:TimeCode')
+                if tc is None:
+                    tc = spec.getattribute('timeCode')
+            finally:
+                inp.close()
+
+            if isinstance(tc, str):
+                match = _TIMECODE_RE.search(tc)
+                return match.group(1) if match else None
+            if isinstance(tc, (tuple, list)) and tc:
+                return smpte_to_timecode(int(tc[0]))
+        except Exception:
+            pass
+        return None
+
+    if IINFO is None:
+        return None
+
     try:
         result = subprocess.run(
-            ['iinfo', '-v', exr_path],
+            [IINFO, '-v', exr_path],
             capture_output=True, text=True, timeout=10
         )
         match = re.search(r'timecode[:\s]+"?(\d{2}:\d{2}:\d{2}[:;]\d{2})"?',
@@ -144,16 +276,197 @@ def get_exr_timecode(exr_path: str) -> Optional[str]:
     return None
 
 
+def get_available_memory_mb() -> int:
+    """Return available system memory in MB (MemAvailable, else physical RAM)."""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (ValueError, OSError):
+        return 0
+
+
+def is_network_path(path: str) -> bool:
+    """Return True if path lives on a network mount (per /proc/mounts)."""
+    path = os.path.realpath(path)
+    best_mount, best_type = "", ""
+    try:
+        with open('/proc/mounts') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount = fields[1].replace('\\040', ' ')
+                if (path == mount or path.startswith(mount.rstrip('/') + '/')) \
+                        and len(mount) > len(best_mount):
+                    best_mount, best_type = mount, fields[2]
+    except OSError:
+        return False
+    return best_type in NETWORK_FS_TYPES
+
+
+def pick_temp_dir(needed_bytes: int = 0) -> str:
+    """
+    Pick a local directory with room for needed_bytes of intermediates
+    (tmpfs / local SSD first). /dev/shm is RAM, so it is skipped when the
+    estimate doesn't fit rather than pushing the node into swap.
+    """
+    needed_bytes = max(needed_bytes, TEMP_MIN_FREE_BYTES)
+    for candidate in TEMP_DIR_CANDIDATES:
+        try:
+            if shutil.disk_usage(candidate).free < needed_bytes:
+                continue
+        except OSError:
+            continue
+        if not is_network_path(candidate):
+            return candidate
+    return TEMP_DIR_CANDIDATES[-1]
+
+
+def sequence_cache_key(seq_info: Dict, start_frame: int, lut_path: str, fps: int) -> str:
+    """
+    Cheap content signature for a sequence: size/mtime of the first, middle and
+    last frames plus the encode settings. Changes whenever frames are
+    re-rendered, added or removed, or the LUT/fps change.
+    """
+    sig = hashlib.blake2b(usedforsecurity=False)
+    sig.update(f"{start_frame}-{seq_info['end']}|{seq_info['count']}|{fps}".encode())
+
+    end_frame = seq_info['end']
+    pad = seq_info['pad']
+    probes = [str(seq_info['dir'] / f"{seq_info['head']}{frame:0{pad}d}{seq_info['ext']}")
+              for frame in (start_frame, (start_frame + end_frame) // 2, end_frame)]
+    for path in probes + [lut_path]:
+        try:
+            st = os.stat(path)
+            sig.update(f"|{path}|{st.st_size}|{st.st_mtime_ns}".encode())
+        except OSError:
+            sig.update(f"|{path}|missing".encode())
+
+    return sig.hexdigest()
+
+
 # =============================================================================
 # Encoding
 # =============================================================================
 
+def _drain_stderr(proc: subprocess.Popen, tail: deque) -> threading.Thread:
+    """Read proc's stderr on a background thread, keeping only the last lines."""
+    def drain():
+        for line in proc.stderr:
+            tail.append(line)
+        proc.stderr.close()
+
+    thread = threading.Thread(target=drain, daemon=True)
+    thread.start()
+    return thread
+
+
+def grade_frames_gpu(seq_info: Dict, start_frame: int, lut_path: str,
+                     temp_dir: str, env: Dict) -> bool:
+    """
+    Grade frames on the GPU with ocioconvert, writing graded.<frame>.exr to temp_dir.
+
+    Returns False if ocioconvert is unavailable or any frame fails (e.g. no
+    GPU / GL context on a render node), so the caller can fall back to oiiotool.
+    """
+    if OCIOCONVERT is None:
+        return False
+
+    pad = seq_info['pad']
+
+    def grade_frame(frame: int) -> Optional[str]:
+        """Grade one frame, return ocioconvert's error text on failure."""
+        src = str(seq_info['dir'] / f"{seq_info['head']}{frame:0{pad}d}{seq_info['ext']}")
+        logc4 = os.path.join(temp_dir, f"logc4.{frame:0{pad}d}.exr")
+        graded = os.path.join(temp_dir, f"graded.{frame:0{pad}d}.exr")
+
+        for cmd in ([OCIOCONVERT, '--gpu', src, 'ACES2065-1', logc4, 'ARRI LogC4'],
+                    [OCIOCONVERT, '--gpu', '--lut', lut_path, logc4, graded]):
+            result = subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.PIPE, text=True)
+            if result.returncode != 0:
+                return result.stderr.strip()
+
+        os.remove(logc4)
+        return None
+
+    # Keep two frames in flight so one frame's EXR read/write overlaps the
+    # other's GPU work
+    frames = range(start_frame, seq_info['end'] + 1)
+    executor = ThreadPoolExecutor(max_workers=GPU_PIPELINE_DEPTH)
+    try:
+        for frame, error in zip(frames, executor.map(grade_frame, frames)):
+            if error is not None:
+                print(f"  WARNING: ocioconvert failed on frame {frame}: {error}")
+                return False
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    return True
+
+
+def run_pipeline(oiio_cmd: List[str], ffmpeg_cmd: List[str], env: Dict, output_path: str) -> bool:
+    """Run oiiotool piped into ffmpeg and report the result."""
+    ffmpeg_proc = subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                   text=True, errors='replace')
+    oiio_proc = subprocess.Popen(oiio_cmd, env=env, stdout=ffmpeg_proc.stdin,
+                                 stderr=subprocess.PIPE, text=True, errors='replace')
+    # oiiotool holds the only write end now, so ffmpeg sees EOF when it exits
+    ffmpeg_proc.stdin.close()
+
+    # Drain both stderr pipes concurrently so neither tool can block on a
+    # full pipe, keeping just the tail for diagnostics
+    oiio_err = deque(maxlen=STDERR_TAIL_LINES)
+    ffmpeg_err = deque(maxlen=STDERR_TAIL_LINES)
+    drains = [_drain_stderr(oiio_proc, oiio_err), _drain_stderr(ffmpeg_proc, ffmpeg_err)]
+
+    oiio_proc.wait()
+    ffmpeg_proc.wait()
+    for drain in drains:
+        drain.join()
+
+    if oiio_proc.returncode != 0 or ffmpeg_proc.returncode != 0:
+        # Report ffmpeg first: if it exits early, oiiotool dies on the broken
+        # pipe (SIGPIPE) and its own stderr says nothing useful
+        if ffmpeg_proc.returncode != 0:
+            print(f"  ERROR: ffmpeg failed (exit {ffmpeg_proc.returncode}): {''.join(ffmpeg_err)}")
+        if oiio_proc.returncode != 0:
+            print(f"  ERROR: oiiotool failed (exit {oiio_proc.returncode}): {''.join(oiio_err)}")
+        # ffmpeg may have muxed whatever arrived before the failure
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        return False
+
+    # Success
+    if os.path.exists(output_path):
+        size_mb = os.path.getsize(output_path) / (1024 * 1024)
+        print(f"  SUCCESS: {output_path} ({size_mb:.1f} MB)")
+        return True
+    else:
+        print(f"  ERROR: Output not created")
+        return False
+
+
 def encode_sequence(
     seq_info: Dict,
     output_path: str,
     lut_path: str,
     fps: int = 24,
-    dry_run: bool = False
+    dry_run: bool = False,
+    threads: int = 0,
+    cache_mb: int = 0,
+    submit_date: Optional[str] = None,
+    gpu: bool = False,
+    force: bool = False,
+    tmp_dir: Optional[str] = None,
+    jobs: int = 1
 ) -> bool:
     """
     Encode a single EXR sequence to editorial MOV.
@@ -161,6 +474,18 @@ def encode_sequence(
     Pipeline: ACES2065-1 → LogC4 → LUT → Rec709 g2.4 → DNxHR SQ
 
     IMPORTANT: Always starts at frame 1000 (slate frame). Errors if missing.
+
+    threads caps oiiotool/ffmpeg threading (0 = use all cores) so several
+    shots can be encoded side by side without oversubscribing the machine.
+    cache_mb raises oiiotool's ImageCache size when it is above oiiotool's
+    default (OIIOTOOL_DEFAULT_CACHE_MB); smaller budgets keep the default.
+    submit_date is the YYYYMMDD burn-in date (default: today).
+    gpu grades with ocioconvert --gpu first, falling back to oiiotool on failure.
+    Its intermediate frames go under tmp_dir (default: pick_temp_dir() sized
+    for this shot, with jobs shots assumed to be staging at the same time).
+
+    Skips the encode if output_path exists and its .cachekey sidecar matches
+    the sequence's current signature, unless force is set.
     """
     # Build input pattern
     frame_pattern = f"%0{seq_info['pad']}d{seq_info['ext']}"
@@ -190,73 +515,124 @@ def encode_sequence(
     print(f"  Frames: {start_frame}-{seq_info['end']} (starting from slate)")
     print(f"  TC:     {tc}")
 
+    # Skip sequences that haven't changed since the last encode
+    cache_key = sequence_cache_key(seq_info, start_frame, lut_path, fps)
+    cache_key_path = f"{output_path}.cachekey"
+    if not force and os.path.exists(output_path):
+        try:
+            with open(cache_key_path) as f:
+                up_to_date = f.read().strip() == cache_key
+        except OSError:
+            up_to_date = False
+        if up_to_date:
+            print("  Up to date - skipping (use --force to re-encode)")
+            return True
+
     if dry_run:
         print("  [DRY RUN] Skipping encode")
         return True
 
-    # Create temp directory (use /mnt/caches for large intermediates)
-    # Global cache location - exists on all render machines including Deadline workers
-    temp_base = "/mnt/caches/cache_ffmpeg"
-    os.makedirs(temp_base, exist_ok=True)
-    temp_dir = tempfile.mkdtemp(prefix="editorial_encode_", dir=temp_base)
-
+    # Set OCIO environment
+    env = os.environ.copy()
+    env['OCIO'] = OCIO_CONFIG
+    env['OPENIMAGEIO_THREADS'] = str(threads)
+
+    # Create output directory
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    # Extract metadata for burn-ins
+    # Shot ID is first part before _SUP_ or _CMP_
+    full_name = seq_info['head'].rstrip('.').rstrip('_')
+    shot_id = re.sub(r'_SUP.*|_CMP.*', '', full_name)
+    video_filename = os.path.basename(output_path)
+    if submit_date is None:
+        submit_date = datetime.date.today().strftime('%Y%m%d')
+    vendor_name = "soup kitchen films"
+
+    # Build filter: crop, letterbox, burn-ins (oiiotool already scaled to 1920 wide)
+    letterbox_h = 35
+    vf = f"crop=1920:1080"
+    vf += f",drawbox=x=0:y=0:w=1920:h={letterbox_h}:color=black@0.5:t=fill"
+    vf += f",drawbox=x=0:y=ih-{letterbox_h}:w=1920:h={letterbox_h}:color=black@0.5:t=fill"
+    vf += f",drawtext=text='{vendor_name}':fontsize=18:fontcolor=white:x=10:y=8"
+    vf += f",drawtext=text='{shot_id}':fontsize=18:fontcolor=white:x=(w-text_w)/2:y=8"
+    vf += f",drawtext=text='{submit_date}':fontsize=18:fontcolor=white:x=w-text_w-10:y=8"
+    vf += f",drawtext=text='{video_filename}':fontsize=18:fontcolor=white:x=10:y=h-text_h-8"
+    vf += f",drawtext=text='%{{frame_num}}':start_number={start_frame}:fontsize=18:fontcolor=white:x=w-text_w-10:y=h-text_h-8"
+
+    # oiiotool streams graded frames to stdout as 8-bit PPMs and ffmpeg reads
+    # them straight from the pipe - no intermediate files on disk.
+    # The stream must start at the slate, so give oiiotool an explicit range
+    # ('#' = 4 digit frame number, '@' = 1 digit each).
+    # Don't add --parallel-frames: frames would reach stdout out of order and
+    # interleaved. Shots are parallelised by the process pool in main() instead.
+    wildcard = '#' if seq_info['pad'] == 4 else '@' * seq_info['pad']
+    oiio_input = str(seq_info['dir'] / f"{seq_info['head']}{wildcard}{seq_info['ext']}")
+    color_ops = [
+        '--colorconvert', 'ACES2065-1', 'ARRI LogC4',
+        '--ociofiletransform', lut_path,
+    ]
+
+    # The GPU temp dir is created inside try so its intermediates are removed
+    # even if the GPU pass raises or is interrupted (Ctrl-C)
+    temp_dir = None
     try:
-        # Set OCIO environment
-        env = os.environ.copy()
-        env['OCIO'] = OCIO_CONFIG
-
-        # Step 1: Color convert with oiiotool
-        print("  [1/2] Color: ACES2065-1 → LogC4 → LUT...")
+        # Optional GPU grade: ocioconvert writes graded EXRs to a temp dir and
+        # oiiotool then only has to quantise and stream them
+        if gpu:
+            print("  Color: ACES2065-1 → LogC4 → LUT on GPU (ocioconvert)...")
+            temp_base = tmp_dir
+            if temp_base is None:
+                # Every frame of the shot is staged before encoding, and up to
+                # `jobs` shots do this at once
+                frame_count = seq_info['end'] - start_frame + 1
+                needed = (frame_count * os.path.getsize(slate_frame_path)
+                          * GPU_TEMP_SIZE_FACTOR * jobs)
+                temp_base = pick_temp_dir(needed)
+            os.makedirs(temp_base, exist_ok=True)
+            temp_dir = tempfile.mkdtemp(prefix="editorial_gpu_", dir=temp_base)
+            if grade_frames_gpu(seq_info, start_frame, lut_path, temp_dir, env):
+                oiio_input = os.path.join(temp_dir, f"graded.{wildcard}.exr")
+                color_ops = []
+            else:
+                print("  GPU grade failed - falling back to CPU (oiiotool)")
+
+        # Auto-tiled ImageCache, enlarged when the memory budget allows, so big
+        # EXRs aren't re-read from disk.
+        # Must be oiiotool flags - its own --cache/--autotile defaults override
+        # anything set through the environment
+        cache_opts = ['--autotile', '64']
+        if cache_mb > OIIOTOOL_DEFAULT_CACHE_MB:
+            cache_opts += ['--cache', str(cache_mb)]
 
         oiio_cmd = [
-            'oiiotool',
-            input_pattern,
-            '--colorconvert', 'ACES2065-1', 'ARRI LogC4',
-            '--ociofiletransform', lut_path,
-            '-d', 'uint16',
-            '-o', f"{temp_dir}/graded.%04d.png"
+            OIIOTOOL,
+            *cache_opts,
+            '--frames', f"{start_frame}-{seq_info['end']}",
+            oiio_input,
+            '--ch', 'R,G,B',
+            *color_ops,
+            # Scale to editorial width here so only HD frames cross the pipe
+            '--resize', '1920x0',
+            # The LUT output is display-referred Rec709 going into 8-bit DNxHR SQ,
+            # so 8 bits (dithered against banding) loses nothing and halves the pipe
+            '--dither',
+            '-d', 'uint8',
+            '-o:fileformatname=pnm', '-'
         ]
 
-        result = subprocess.run(oiio_cmd, env=env, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"  ERROR: oiiotool failed: {result.stderr}")
-            return False
-
-        # Step 2: Encode with FFmpeg
-        print("  [2/2] Encoding DNxHR SQ...")
-
-        # Create output directory
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-        # Extract metadata for burn-ins
-        # Shot ID is first part before _SUP_ or _CMP_
-        full_name = seq_info['head'].rstrip('.').rstrip('_')
-        shot_id = re.sub(r'_SUP.*|_CMP.*', '', full_name)
-        video_filename = os.path.basename(output_path)
-        submit_date = subprocess.run(['date', '+%Y%m%d'], capture_output=True, text=True).stdout.strip()
-        vendor_name = "soup kitchen films"
-
-        # Build filter: scale, crop, letterbox, burn-ins
-        letterbox_h = 35
-        vf = f"scale=1920:-1,crop=1920:1080"
-        vf += f",drawbox=x=0:y=0:w=1920:h={letterbox_h}:color=black@0.5:t=fill"
-        vf += f",drawbox=x=0:y=ih-{letterbox_h}:w=1920:h={letterbox_h}:color=black@0.5:t=fill"
-        vf += f",drawtext=text='{vendor_name}':fontsize=18:fontcolor=white:x=10:y=8"
-        vf += f",drawtext=text='{shot_id}':fontsize=18:fontcolor=white:x=(w-text_w)/2:y=8"
-        vf += f",drawtext=text='{submit_date}':fontsize=18:fontcolor=white:x=w-text_w-10:y=8"
-        vf += f",drawtext=text='{video_filename}':fontsize=18:fontcolor=white:x=10:y=h-text_h-8"
-        vf += f",drawtext=text='%{{frame_num}}':start_number={start_frame}:fontsize=18:fontcolor=white:x=w-text_w-10:y=h-text_h-8"
-
         ffmpeg_cmd = [
-            'ffmpeg', '-y',
-            '-threads', '0',
+            FFMPEG, '-y',
+            '-nostats', '-loglevel', 'error',
+            '-threads', str(threads),
+            '-f', 'image2pipe',
             '-framerate', str(fps),
-            '-start_number', str(start_frame),
-            '-i', f"{temp_dir}/graded.%04d.png",
-            '-filter_threads', '0',
+            '-c:v', 'ppm',
+            '-i', '-',
+            '-filter_threads', str(threads),
             '-vf', vf,
             '-c:v', 'dnxhd',
-            '-threads', '0',
+            '-threads', str(threads),
             '-profile:v', DNXHR_PROFILE,
             '-pix_fmt', 'yuv422p',
             '-timecode', tc,
@@ -267,23 +643,37 @@ def encode_sequence(
             output_path
         ]
 
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"  ERROR: ffmpeg failed: {result.stderr}")
-            return False
-
-        # Success
-        if os.path.exists(output_path):
-            size_mb = os.path.getsize(output_path) / (1024 * 1024)
-            print(f"  SUCCESS: {output_path} ({size_mb:.1f} MB)")
-            return True
+        if color_ops:
+            print("  Color: ACES2065-1 → LogC4 → LUT → DNxHR SQ (streaming)...")
         else:
-            print(f"  ERROR: Output not created")
-            return False
+            print("  Encoding DNxHR SQ (streaming)...")
 
+        # Drop any old key first so a failed re-encode is never seen as current
+        if os.path.exists(cache_key_path):
+            os.remove(cache_key_path)
+        if not run_pipeline(oiio_cmd, ffmpeg_cmd, env, output_path):
+            return False
+        with open(cache_key_path, 'w') as f:
+            f.write(cache_key + '\n')
+        return True
     finally:
-        # Cleanup temp directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def encode_sequence_logged(*args, **kwargs) -> Tuple[bool, str]:
+    """
+    Run encode_sequence in a pool worker, returning (ok, log) with everything it
+    printed, so the parent can print each shot's log as one uninterleaved block.
+    """
+    log = io.StringIO()
+    with redirect_stdout(log):
+        try:
+            ok = encode_sequence(*args, **kwargs)
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            ok = False
+    return ok, log.getvalue()
 
 
 # =============================================================================
@@ -305,6 +695,15 @@ def main():
                         help=f"Frame rate (default: {DEFAULT_FPS})")
     parser.add_argument("--dry-run", action="store_true",
                         help="Show what would be processed without encoding")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                        help=f"Sequences to encode in parallel (default: {DEFAULT_JOBS})")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-encode even if a sequence is unchanged since its last encode")
+    parser.add_argument("--gpu", action="store_true",
+                        help="Color convert on the GPU with ocioconvert (falls back to CPU)")
+    parser.add_argument("--tmp-dir",
+                        help="Directory for --gpu intermediate frames "
+                             "(default: /dev/shm, else local /tmp, else /mnt/caches/cache_ffmpeg)")
 
     args = parser.parse_args()
 
@@ -313,11 +712,27 @@ def main():
         print(f"ERROR: Input directory not found: {args.input_dir}")
         return 1
 
+    if args.jobs < 1:
+        print(f"ERROR: --jobs must be at least 1, got {args.jobs}")
+        return 1
+
     # Validate LUT
     if not args.dry_run and not os.path.isfile(args.lut):
         print(f"ERROR: LUT not found: {args.lut}")
         return 1
 
+    # Validate tools
+    if not args.dry_run:
+        if OIIOTOOL is None:
+            print("ERROR: oiiotool not found. Install OpenImageIO.")
+            return 1
+        if FFMPEG is None:
+            print("ERROR: ffmpeg not found.")
+            return 1
+        if args.gpu and OCIOCONVERT is None:
+            print("WARNING: ocioconvert not found - color converting on CPU")
+            args.gpu = False
+
     # Set output directory
     output_dir = args.output_dir or os.path.join(args.input_dir, "editorial")
 
@@ -328,6 +743,10 @@ def main():
     print(f"Output: {output_dir}")
     print(f"LUT:    {os.path.basename(args.lut)}")
     print(f"FPS:    {args.fps}")
+    print(f"Jobs:   {args.jobs}")
+    if args.gpu:
+        print("Color:  GPU (ocioconvert)")
+        print(f"Temp:   {args.tmp_dir or 'auto (picked per shot by size)'}")
     if args.shot:
         print(f"Filter: {args.shot}")
     if args.dry_run:
@@ -343,23 +762,62 @@ def main():
 
     print(f"Found {len(sequences)} sequence(s)")
 
-    # Process each sequence
+    # Process sequences in parallel - each shot writes its own MOV.
+    # Shots deliberately get their own oiiotool rather than one combined
+    # --frames command: each streams to its own ffmpeg over stdout, and
+    # oiiotool's startup/OCIO load (~0.1 s) is noise next to an encode.
     success_count = 0
     fail_count = 0
-
-    for seq in sequences:
-        # Build output filename
-        shot_name = seq['head'].rstrip('.').rstrip('_')
-        output_path = os.path.join(output_dir, f"{shot_name}.mov")
-
-        if encode_sequence(seq, output_path, args.lut, args.fps, args.dry_run):
-            success_count += 1
-        else:
-            fail_count += 1
+    failed_shots = []
+
+    # Split the cores between concurrent shots
+    threads_per_job = max(1, (os.cpu_count() or 1) // args.jobs)
+    cache_mb_per_job = int(get_available_memory_mb() * IMAGECACHE_MEMORY_FRACTION) // args.jobs
+
+    # Same burn-in date for every shot in the batch
+    submit_date = datetime.date.today().strftime('%Y%m%d')
+
+    # Dry runs only print, so keep their output in order
+    max_workers = 1 if args.dry_run else args.jobs
+
+    # Flush the header so forked workers don't repeat it
+    sys.stdout.flush()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for seq in sequences:
+            # Build output filename
+            shot_name = seq['head'].rstrip('.').rstrip('_')
+            output_path = os.path.join(output_dir, f"{shot_name}.mov")
+
+            future = executor.submit(encode_sequence_logged, seq, output_path, args.lut,
+                                     args.fps, args.dry_run, threads_per_job,
+                                     cache_mb_per_job, submit_date, args.gpu,
+                                     args.force, args.tmp_dir, args.jobs)
+            futures[future] = shot_name
+
+        for future in as_completed(futures):
+            shot_name = futures[future]
+            try:
+                ok, log = future.result()
+            except Exception as e:
+                ok, log = False, f"\n  ERROR: {shot_name} crashed: {e}\n"
+
+            # Each shot's output arrives as one block, however many ran at once
+            print(log, end='')
+            if ok:
+                success_count += 1
+            else:
+                fail_count += 1
+                failed_shots.append(shot_name)
+                print(f"FAILED: {shot_name}")
+            sys.stdout.flush()
 
     # Summary
     print(f"\n{'='*60}")
     print(f"Summary: {success_count} succeeded, {fail_count} failed")
+    for shot_name in sorted(failed_shots):
+        print(f"  FAILED: {shot_name}")
     print("="*60)
 
     return 0 if fail_count == 0 else 1
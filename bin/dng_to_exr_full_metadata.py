@@ -4,11 +4,12 @@ DNG to EXR Batch Converter with FULL Metadata Preservation
 Converts DJI X9 DNG files to EXR with DWAA compression, preserving ALL metadata
 
 Usage:
-    dng_to_exr_full_metadata.py INPUT_DIR OUTPUT_DIR [COMPRESSION_LEVEL]
+    dng_to_exr_full_metadata.py INPUT_DIR OUTPUT_DIR [COMPRESSION_LEVEL] [--jobs N]
 
 Examples:
     dng_to_exr_full_metadata.py "/path/to/dng/" "/path/to/exr/" 45
     dng_to_exr_full_metadata.py "G001C0008_250204_J1PS60" "exr_output"
+    dng_to_exr_full_metadata.py "/path/to/dng/" "/path/to/exr/" 45 --jobs 8
 
 Features:
     - Preserves ALL 34+ metadata fields from DNG
@@ -16,15 +17,20 @@ Features:
     - Renames oiio:* → DNG:oiio_* for EXR compatibility
     - DWAA compression (default: 45)
     - Half-float precision (16-bit per channel)
+    - Parallel conversion (--jobs, default: one per CPU core)
     - Progress reporting
 """
 
 import sys
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import OpenImageIO as oiio
 
+# DNG attribute name -> EXR-safe name, filled in as names are first seen
+_ATTR_RENAME_CACHE = {}
+
 def print_usage():
     print(__doc__)
     sys.exit(1)
@@ -43,38 +49,39 @@ def convert_dng_to_exr(input_path, output_path, compression_level=45, verbose=Fa
 
         in_spec = input_buf.spec()
 
-        # Create output spec starting from input
-        out_spec = oiio.ImageSpec(in_spec)
+        # Modify the spec in place and write straight from the input buffer -
+        # no second full-resolution ImageBuf or pixel copy
+        out_spec = input_buf.specmod()
         out_spec.attribute("compression", f"dwaa:{compression_level}")
 
         # Copy ALL attributes, renaming problematic ones for EXR
-        for attrib in in_spec.extra_attribs:
-            attrib_name = attrib.name
-            attrib_type = attrib.type
-            attrib_value = attrib.value
-
-            # Rename problematic prefixes
-            new_name = attrib_name
-            if attrib_name.startswith("raw:"):
-                new_name = "DNG:" + attrib_name.replace(":", "_")
-            elif attrib_name.startswith("oiio:"):
-                new_name = "DNG:" + attrib_name.replace(":", "_")
+        # (snapshot them first - we're adding to the same spec)
+        attribs = [(a.name, a.type, a.value) for a in in_spec.extra_attribs]
+        for attrib_name, attrib_type, attrib_value in attribs:
+            # Rename problematic prefixes (same names on every file, so cache)
+            new_name = _ATTR_RENAME_CACHE.get(attrib_name)
+            if new_name is None:
+                new_name = attrib_name
+                if attrib_name.startswith(("raw:", "oiio:")):
+                    new_name = "DNG:" + attrib_name.replace(":", "_")
+                _ATTR_RENAME_CACHE[attrib_name] = new_name
 
             # Set attribute with proper type
             out_spec.attribute(new_name, attrib_type, attrib_value)
 
         # Write output
-        output_buf = oiio.ImageBuf(out_spec)
-        oiio.ImageBufAlgo.copy(output_buf, input_buf)
-
-        if not output_buf.write(str(output_path)):
-            return False, f"Write error: {output_buf.geterror()}"
+        if not input_buf.write(str(output_path)):
+            return False, f"Write error: {input_buf.geterror()}"
 
         return True, "OK"
 
     except Exception as e:
         return False, str(e)
 
+def init_worker(threads):
+    """Limit OIIO's thread pool so parallel workers don't oversubscribe the CPU"""
+    oiio.attribute("threads", threads)
+
 def format_time(seconds):
     """Format seconds as MM:SS"""
     mins = int(seconds // 60)
@@ -83,12 +90,22 @@ def format_time(seconds):
 
 def main():
     # Parse arguments
-    if len(sys.argv) < 3:
+    args = sys.argv[1:]
+    jobs = os.cpu_count() or 1
+    if "--jobs" in args:
+        i = args.index("--jobs")
+        try:
+            jobs = int(args[i + 1])
+        except (IndexError, ValueError):
+            print_usage()
+        del args[i:i + 2]
+
+    if len(args) < 2:
         print_usage()
 
-    input_dir = Path(sys.argv[1])
-    output_dir = Path(sys.argv[2])
-    compression_level = int(sys.argv[3]) if len(sys.argv) > 3 else 45
+    input_dir = Path(args[0])
+    output_dir = Path(args[1])
+    compression_level = int(args[2]) if len(args) > 2 else 45
 
     # Validate arguments
     if not input_dir.exists():
@@ -103,6 +120,10 @@ def main():
         print(f"ERROR: Compression level must be 30-100, got {compression_level}")
         sys.exit(1)
 
+    if jobs < 1:
+        print(f"ERROR: --jobs must be at least 1, got {jobs}")
+        sys.exit(1)
+
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -122,6 +143,7 @@ def main():
     print(f"Files:       {len(dng_files)} DNG files")
     print(f"Compression: DWAA level {compression_level}")
     print(f"Format:      half (16-bit float)")
+    print(f"Jobs:        {jobs}")
     print()
     print("Metadata Preservation:")
     print("  ✓ All camera metadata (Make, Model, Serial, ISO, etc.)")
@@ -136,27 +158,42 @@ def main():
     processed = 0
     failed = 0
 
-    # Process each file
-    for dng_file in dng_files:
-        output_file = output_dir / f"{dng_file.stem}.exr"
-
-        success, message = convert_dng_to_exr(dng_file, output_file, compression_level)
-
-        if success:
-            processed += 1
-        else:
-            failed += 1
-            print(f"  ✗ FAILED: {dng_file.name} - {message}")
-
-        # Progress reporting (every 10 files or last file)
-        if (processed % 10 == 0) or (processed + failed == len(dng_files)):
-            percent = int((processed + failed) * 100 / len(dng_files))
-            elapsed = time.time() - start_time
-            rate = processed / elapsed if elapsed > 0 else 0
-            eta = (len(dng_files) - processed - failed) / rate if rate > 0 else 0
-
-            print(f"  [{percent:3d}%] {processed} / {len(dng_files)} files  "
-                  f"({rate:.1f} fps, ETA: {format_time(eta)})")
+    # Process files in parallel - each DNG writes its own EXR
+    threads_per_job = max(1, (os.cpu_count() or 1) // jobs)
+
+    # Flush the header so forked workers don't repeat it
+    sys.stdout.flush()
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                             initargs=(threads_per_job,)) as executor:
+        futures = {}
+        for dng_file in dng_files:
+            output_file = output_dir / f"{dng_file.stem}.exr"
+            future = executor.submit(convert_dng_to_exr, dng_file, output_file, compression_level)
+            futures[future] = dng_file
+
+        for future in as_completed(futures):
+            dng_file = futures[future]
+            try:
+                success, message = future.result()
+            except Exception as e:
+                success, message = False, str(e)
+
+            if success:
+                processed += 1
+            else:
+                failed += 1
+                print(f"  ✗ FAILED: {dng_file.name} - {message}")
+
+            # Progress reporting (every 10 files or last file)
+            if (processed % 10 == 0) or (processed + failed == len(dng_files)):
+                percent = int((processed + failed) * 100 / len(dng_files))
+                elapsed = time.time() - start_time
+                rate = processed / elapsed if elapsed > 0 else 0
+                eta = (len(dng_files) - processed - failed) / rate if rate > 0 else 0
+
+                print(f"  [{percent:3d}%] {processed} / {len(dng_files)} files  "
+                      f"({rate:.1f} fps, ETA: {format_time(eta)})")
 
     # Calculate statistics
     end_time = time.time()